@@ -1,20 +1,53 @@
 #!/data/data/com.termux/files/usr/bin/env #!/data/data/com.termux/files/usr/bin/python
 
+import functools
 import re
+import shutil
 import subprocess
 import time
+import zlib
 import http.client
 import json
+from pathlib import Path
 from urllib.parse import urlparse
 
+try:
+    import orjson
+
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:  # orjson is optional, stdlib json works the same here
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
 DISCORD_WEBHOOK_URL = ""
 USERNAME = "RN10P"
 AVATAR_URL = (
     "https://cdn.discordapp.com/app-assets/1049685078508314696/1249009769075703888.png"
 )
+BASE_PAYLOAD = {
+    "username": USERNAME,
+    "avatar_url": AVATAR_URL,
+    "content": "## Network interface information",
+}
+EMBED_COLORS = tuple(3447003 + i * 1000000 for i in range(5))
+
+# one pass over the whole ifconfig output, [ \t] keeps every match on a single line.
+# matched on raw bytes, only the captured groups get decoded
+IFCONFIG_RE = re.compile(
+    rb"^(?P<iface>\w+[\w\d_]*): "
+    rb"|inet (?P<v4>\d+\.\d+\.\d+\.\d+)"
+    rb"(?:[ \t]+netmask (?P<netmask>\d+\.\d+\.\d+\.\d+))?"
+    rb"(?:[ \t]+destination (?P<destination>\d+\.\d+\.\d+\.\d+))?"
+    rb"|inet6 (?P<v6>[a-f0-9:]+)[ \t]+prefixlen (?P<prefixlen>\d+)",
+    re.MULTILINE,
+)
 
 
-def send_discord_message(embed: dict) -> None:
+def send_discord_message(embed: bytes) -> None:
     try:
         url = urlparse(DISCORD_WEBHOOK_URL)
 
@@ -35,145 +68,90 @@ def send_discord_message(embed: dict) -> None:
 
 
 def compare_states(old_state: dict, new_state: dict) -> bool:
-    if set(old_state.keys()) != set(new_state.keys()):
-        return True
+    # common case, nothing moved: plain dict equality, no sets built
+    if old_state is new_state or old_state == new_state:
+        return False
 
-    for interface in set(old_state.keys()) & set(new_state.keys()):
-        old_ipv4 = {tuple(sorted(d.items())) for d in old_state[interface]["ipv4"]}
-        new_ipv4 = {tuple(sorted(d.items())) for d in new_state[interface]["ipv4"]}
-        old_ipv6 = {tuple(sorted(d.items())) for d in old_state[interface]["ipv6"]}
-        new_ipv6 = {tuple(sorted(d.items())) for d in new_state[interface]["ipv6"]}
+    if old_state.keys() != new_state.keys():
+        return True
 
-        if old_ipv4 != new_ipv4 or old_ipv6 != new_ipv6:
+    # addresses are already hashable tuples, only the order is ignored
+    for interface, data in new_state.items():
+        old_data = old_state[interface]
+        if set(old_data["ipv4"]) != set(data["ipv4"]):
+            return True
+        if set(old_data["ipv6"]) != set(data["ipv6"]):
             return True
 
     return False
 
 
-def get_ifconfig_output():
-    try:
-        result = subprocess.run(["ifconfig"], capture_output=True, text=True)
+# resolved once with shutil.which, no more FileNotFoundError round trips per tick
+IFCONFIG_BINS = tuple(
+    dict.fromkeys(
+        path
+        for path in map(shutil.which, ("ifconfig", "/sbin/ifconfig"))
+        if path is not None
+    )
+)
+
+
+def get_ifconfig_output() -> bytes:
+    if not IFCONFIG_BINS:
+        # no ifconfig here (testing off-device), fall back to the bundled sample
+        sample = Path(__file__).with_name("iface.sample")
+        return sample.read_bytes() if sample.exists() else b""
+
+    stdout = b""
+    for ifconfig_bin in IFCONFIG_BINS:
+        result = subprocess.run([ifconfig_bin], capture_output=True)
+        stdout = result.stdout
         if result.returncode == 0:
-            return result.stdout
-
-        result = subprocess.run(["/sbin/ifconfig"], capture_output=True, text=True)
-        return result.stdout
-
-    except FileNotFoundError:
-        return """
-dummy0: flags=195<UP,BROADCAST,RUNNING,NOARP>  mtu 1500
-        inet6 fe80::3c17:e9ff:fe59:5f1  prefixlen 64  scopeid 0x20<link>
-        ether 3e:17:e9:59:05:f1  txqueuelen 1000  (Ethernet)
-        RX packets 0  bytes 0 (0.0 B)
-        RX errors 0  dropped 0  overruns 0  frame 0
-        TX packets 528  bytes 107978 (105.4 KiB)
-        TX errors 0  dropped 0 overruns 0  carrier 0  collisions 0
-
-lo: flags=73<UP,LOOPBACK,RUNNING>  mtu 65536
-        inet 127.0.0.1  netmask 255.0.0.0
-        inet6 ::1  prefixlen 128  scopeid 0x10<host>
-        loop  txqueuelen 1000  (Local Loopback)
-        RX packets 1859  bytes 105572 (103.0 KiB)
-        RX errors 0  dropped 0  overruns 0  frame 0
-        TX packets 1859  bytes 105572 (103.0 KiB)
-        TX errors 0  dropped 0 overruns 0  carrier 0  collisions 0
-
-r_rmnet_data0: flags=65<UP,RUNNING>  mtu 1500
-        inet6 fe80::62e0:cf72:8c10:8f9f  prefixlen 64  scopeid 0x20<link>
-        unspec 00-00-00-00-00-00-00-00-00-00-00-00-00-00-00-00  txqueuelen 1000  (UNSPEC)
-        RX packets 0  bytes 0 (0.0 B)
-        RX errors 0  dropped 0  overruns 0  frame 0
-        TX packets 128  bytes 7124 (6.9 KiB)
-        TX errors 0  dropped 0 overruns 0  carrier 0  collisions 0
-
-rmnet_data0: flags=65<UP,RUNNING>  mtu 1500
-        inet6 fe80::16d3:a95c:452a:3d76  prefixlen 64  scopeid 0x20<link>
-        unspec 00-00-00-00-00-00-00-00-00-00-00-00-00-00-00-00  txqueuelen 1000  (UNSPEC)
-        RX packets 24  bytes 3351 (3.2 KiB)
-        RX errors 0  dropped 0  overruns 0  frame 0
-        TX packets 33  bytes 2436 (2.3 KiB)
-        TX errors 0  dropped 0 overruns 0  carrier 0  collisions 0
-
-rmnet_ipa0: flags=65<UP,RUNNING>  mtu 9216
-        unspec 00-00-00-00-00-00-00-00-00-00-00-00-00-00-00-00  txqueuelen 1000  (UNSPEC)
-        RX packets 10  bytes 3209 (3.1 KiB)
-        RX errors 0  dropped 0  overruns 0  frame 0
-        TX packets 161  bytes 10848 (10.5 KiB)
-        TX errors 0  dropped 0 overruns 0  carrier 0  collisions 0
-
-tun0: flags=81<UP,POINTOPOINT,RUNNING>  mtu 1280
-        inet 100.96.0.4  netmask 255.255.255.255  destination 100.96.0.4
-        inet6 fe80::2c2a:3f37:3e90:94d0  prefixlen 64  scopeid 0x20<link>
-        inet6 2606:4700:110:8747:69ce:4da:d448:ea2c  prefixlen 128  scopeid 0x0<global>
-        unspec 00-00-00-00-00-00-00-00-00-00-00-00-00-00-00-00  txqueuelen 500  (UNSPEC)
-        RX packets 258881  bytes 297583689 (283.7 MiB)
-        RX errors 0  dropped 0  overruns 0  frame 0
-        TX packets 152248  bytes 12026144 (11.4 MiB)
-        TX errors 0  dropped 390 overruns 0  carrier 0  collisions 0
-
-wlan0: flags=4163<UP,BROADCAST,RUNNING,MULTICAST>  mtu 1500
-        inet 192.168.1.100  netmask 255.255.255.0  broadcast 192.168.1.255
-        inet6 fe80::44eb:35ff:fe65:ce21  prefixlen 64  scopeid 0x20<link>
-        inet6 2001:ee0:e9fa:2040:44eb:35ff:fe65:ce21  prefixlen 64  scopeid 0x0<global>
-        inet6 2001:ee0:e9fa:2040:7bd4:7968:cce2:cb83  prefixlen 64  scopeid 0x0<global>
-        ether 46:eb:35:65:ce:21  txqueuelen 3000  (Ethernet)
-        RX packets 2525062  bytes 1677342759 (1.5 GiB)
-        RX errors 0  dropped 0  overruns 0  frame 0
-        TX packets 2965233  bytes 2395305804 (2.2 GiB)
-        TX errors 0  dropped 0 overruns 0  carrier 0  collisions 0
-"""
-
-
-def parse_network_interfaces(ifconfig_output):
-    interface_pattern = r"^(\w+[\w\d_]*): "
-
-    inet_pattern = r"inet (\d+\.\d+\.\d+\.\d+)(?:\s+netmask (\d+\.\d+\.\d+\.\d+))?(?:\s+destination (\d+\.\d+\.\d+\.\d+))?"
-    inet6_pattern = r"inet6 ([a-f0-9:]+)\s+prefixlen (\d+)"
+            break
 
+    # never the fake sample on a real device, even when every ifconfig fails
+    return stdout
+
+
+def parse_network_interfaces(ifconfig_output: bytes) -> dict:
     interfaces = {}
-    current_interface = None
+    current = None
 
-    for line in ifconfig_output.splitlines():
-        interface_match = re.match(interface_pattern, line)
-        if interface_match:
-            current_interface = interface_match.group(1)
-            interfaces[current_interface] = {"ipv4": [], "ipv6": []}
+    for match in IFCONFIG_RE.finditer(ifconfig_output):
+        name, v4, netmask, destination, v6, prefixlen = match.groups()
+        if name:
+            current = interfaces[name.decode()] = {"ipv4": [], "ipv6": []}
+        elif current is None:
             continue
-
-        if current_interface:
-            inet_match = re.search(inet_pattern, line)
-            if inet_match:
-                ipv4_info = {
-                    "address": inet_match.group(1),
-                    "netmask": inet_match.group(2) if inet_match.group(2) else None,
-                    "destination": inet_match.group(3) if inet_match.group(3) else None,
-                }
-                interfaces[current_interface]["ipv4"].append(ipv4_info)
-
-            inet6_match = re.search(inet6_pattern, line)
-            if inet6_match:
-                ipv6_info = {
-                    "address": inet6_match.group(1),
-                    "prefixlen": inet6_match.group(2),
-                }
-                interfaces[current_interface]["ipv6"].append(ipv6_info)
+        elif v4:
+            current["ipv4"].append(
+                (
+                    v4.decode(),
+                    netmask.decode() if netmask else None,
+                    destination.decode() if destination else None,
+                )
+            )
+        else:
+            current["ipv6"].append((v6.decode(), prefixlen.decode()))
 
     return interfaces
 
 
-def format_interface_info(interface_name: str, data: dict) -> dict:
+@functools.lru_cache(maxsize=64)
+def format_interface_info(interface_name: str, ipv4: tuple, ipv6: tuple) -> dict:
+    # cached per interface state, the returned dict is shared so don't mutate it
     ipv4_info = []
-    for ip in data["ipv4"]:
-        info = f"Address: {ip['address']}"
-        if ip["netmask"]:
-            info += f"\nNetmask: {ip['netmask']}"
-        if ip["destination"]:
-            info += f"\nDestination: {ip['destination']}"
+    for address, netmask, destination in ipv4:
+        info = f"Address: {address}"
+        if netmask:
+            info += f"\nNetmask: {netmask}"
+        if destination:
+            info += f"\nDestination: {destination}"
         ipv4_info.append(info)
 
     ipv6_info = []
-    for ip in data["ipv6"]:
-        ipv6_info.append(f"Address: {ip['address']}\nPrefix Length: {ip['prefixlen']}")
+    for address, prefixlen in ipv6:
+        ipv6_info.append(f"Address: {address}\nPrefix Length: {prefixlen}")
 
     field_value = ""
     if ipv4_info:
@@ -188,24 +166,23 @@ def format_interface_info(interface_name: str, data: dict) -> dict:
     }
 
 
-def build_embed(interfaces: dict) -> str:
+def build_embed(interfaces: dict) -> bytes:
     embeds_list = []
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     for interface, data in interfaces.items():
         embed = {
             "title": f"Interface: {interface}",
-            "color": 3447003 + hash(interface) % 5 * 1000000,
-            "fields": [format_interface_info(interface, data)],
-            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "color": EMBED_COLORS[zlib.crc32(interface.encode()) % len(EMBED_COLORS)],
+            "fields": [
+                format_interface_info(
+                    interface, tuple(data["ipv4"]), tuple(data["ipv6"])
+                )
+            ],
+            "timestamp": timestamp,
         }
         embeds_list.append(embed)
 
-    payload = {
-        "username": USERNAME,
-        "avatar_url": AVATAR_URL,
-        "content": "## Network interface information",
-        "embeds": embeds_list,
-    }
-    return json.dumps(payload)
+    return json_dumps({**BASE_PAYLOAD, "embeds": embeds_list})
 
 
 def monitor_network_changes():
@@ -216,9 +193,12 @@ def monitor_network_changes():
             current_state = parse_network_interfaces(get_ifconfig_output())
             changes = compare_states(previous_state, current_state)
             if changes and "wlan0" in current_state:
-                embed = build_embed(current_state)
-                send_discord_message(embed)
-                print("Network change detected, sent update to Discord")
+                if DISCORD_WEBHOOK_URL:
+                    embed = build_embed(current_state)
+                    send_discord_message(embed)
+                    print("Network change detected, sent update to Discord")
+                else:
+                    print("Network change detected, no webhook url set")
 
             previous_state = current_state
             time.sleep(5)
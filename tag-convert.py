@@ -1,3 +1,4 @@
+import functools
 import re
 import shutil
 import subprocess
@@ -39,6 +40,11 @@ MOVE_CHARACTERS_TO_GENRE = True
 FIX_MULTIPLE_VALUES = True
 FIX_DUPLICATE_SUMMARY = True
 
+# Patterns
+BRACKETED_RE = re.compile(r"\[.*?]|\(.*?\)|\{.*?\}")
+PIPE_RE = re.compile(r".*\|")
+LANGUAGE_CODE_RE = re.compile(r"\((\w+)\)")
+
 
 class SkipThresholdReached(Exception):
     pass
@@ -232,15 +238,20 @@ class ComicParser:
 
         self.__unpack_zip(self.path)
 
+    @classmethod
+    @functools.cache
+    def xml_fields(cls) -> dict[str, tuple[str, type]]:
+        # field -> (ComicInfo.xml key, type), built once per class
+        return {
+            k: ("".join(i.title() for i in k.split("_")), v)
+            for k, v in cls.__annotations__.items()
+        }
+
     def __unpack_zip(self, path: Union[Path, str]):
         def __info(items: dict) -> dict:
             copycat = items.copy()
             content = {}
-            fields = {
-                k: ("".join(i.title() for i in k.split("_")), v)
-                for k, v in self.__annotations__.items()
-            }
-            for key, (field_key, field_type) in fields.items():
+            for key, (field_key, field_type) in self.xml_fields().items():
                 if field_key in items:
                     setattr(self, key, field_type(items[field_key]))
                     copycat.pop(field_key)
@@ -279,12 +290,7 @@ class ComicParser:
 
         def __info():
             content = {}
-            fields = {
-                "".join(i.title() for i in k.split("_")): k
-                for k, _ in self.__annotations__.items()
-            }
-
-            for field_key, key in fields.items():
+            for key, (field_key, _) in self.xml_fields().items():
                 value = getattr(self, key)
                 if value and value != -1 and value != "":
                     content[field_key] = value
@@ -337,15 +343,9 @@ class ComicParser:
 
 
 def clean_manga_title(manga_title):
-    edited_title = re.sub(r"\[.*?]", "", manga_title).strip()
-    edited_title = re.sub(r"\(.*?\)", "", edited_title).strip()
-    edited_title = re.sub(r"\{.*?\}", "", edited_title).strip()
-
-    while True:
-        if "|" in edited_title:
-            edited_title = re.sub(r".*\|", "", edited_title).strip()
-        else:
-            break
+    edited_title = BRACKETED_RE.sub("", manga_title)
+    # greedy, so this already drops everything up to the last "|"
+    edited_title = PIPE_RE.sub("", edited_title, count=1).strip()
 
     if manga_title != edited_title:
         cprint.debug(f"Cleaned title: {manga_title} -> {edited_title}")
@@ -378,8 +378,7 @@ def fix_characters_to_genre(comic_parser: ComicParser):
 def fix_language(comic_parser: ComicParser):
     # missing language tag, check in path for code or use default: EN
     if comic_parser.language_iso == "":
-        regex = re.compile(r"\((\w+)\)")
-        match = regex.search(str(comic_parser.path.parent))
+        match = LANGUAGE_CODE_RE.search(str(comic_parser.path.parent))
         final_match = match.groups()[-1] if match else "en"
 
         lang = langcodes.find(final_match)